@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from typing import Tuple
 
 from brian2 import Quantity, Subgroup, Unit, meter, mm, np
@@ -47,7 +48,7 @@ def assign_coords_grid_rect_prism(
     ValueError
         When the shape is incompatible with the number of neurons in the group
     """
-    num_grid_elements = np.prod(shape)
+    num_grid_elements = math.prod(shape)
     if num_grid_elements != len(neuron_group):
         raise ValueError(
             f"Number of elements specified in shape ({num_grid_elements}) "
@@ -58,7 +59,9 @@ def assign_coords_grid_rect_prism(
     y = np.linspace(ylim[0], ylim[1], shape[1])
     z = np.linspace(zlim[0], zlim[1], shape[2])
 
-    x, y, z = np.meshgrid(x, y, z, indexing="ij")
+    # broadcast views rather than full copies: assign_xyz flattens each axis,
+    # so only the final 1D coordinate arrays get materialized
+    x, y, z = np.meshgrid(x, y, z, indexing="ij", copy=False)
     assign_xyz(neuron_group, x, y, z, unit=unit)
 
 
@@ -84,9 +87,9 @@ def assign_coords_rand_rect_prism(
     unit : Unit, optional
         Brian unit to specify scale implied in limits, by default mm
     """
-    x = (xlim[1] - xlim[0]) * rng.random(len(neuron_group)) + xlim[0]
-    y = (ylim[1] - ylim[0]) * rng.random(len(neuron_group)) + ylim[0]
-    z = (zlim[1] - zlim[0]) * rng.random(len(neuron_group)) + zlim[0]
+    x = rng.uniform(*xlim, len(neuron_group))
+    y = rng.uniform(*ylim, len(neuron_group))
+    z = rng.uniform(*zlim, len(neuron_group))
     assign_xyz(neuron_group, x, y, z, unit)
 
 
@@ -114,11 +117,12 @@ def assign_coords_rand_cylinder(
     """
     xyz_start = np.array(xyz_start)
     xyz_end = np.array(xyz_end)
+    # one draw for all three cylindrical coordinates (same stream as 3 draws)
+    u_r, u_theta, u_z = rng.random((3, len(neuron_group)))
     # sample uniformly over r**2 for equal area
-    rs = np.sqrt(radius**2 * rng.random(len(neuron_group)))
-    thetas = 2 * np.pi * rng.random(len(neuron_group))
-    cyl_length = np.linalg.norm(xyz_end - xyz_start)
-    z_cyls = cyl_length * rng.random(len(neuron_group))
+    rs = radius * np.sqrt(u_r)
+    thetas = 2 * np.pi * u_theta
+    z_cyls = _cyl_length(xyz_start, xyz_end) * u_z
 
     xs, ys, zs = xyz_from_rθz(rs, thetas, z_cyls, xyz_start, xyz_end)
 
@@ -149,7 +153,7 @@ def assign_coords_uniform_cylinder(
     """
     xyz_start = np.array(xyz_start)
     xyz_end = np.array(xyz_end)
-    cyl_length = np.linalg.norm(xyz_end - xyz_start)
+    cyl_length = _cyl_length(xyz_start, xyz_end)
 
     rs, thetas, z_cyls = uniform_cylinder_rθz(len(neuron_group), radius, cyl_length)
     xs, ys, zs = xyz_from_rθz(rs, thetas, z_cyls, xyz_start, xyz_end)
@@ -157,6 +161,12 @@ def assign_coords_uniform_cylinder(
     assign_xyz(neuron_group, xs, ys, zs, unit)
 
 
+def _cyl_length(xyz_start: np.ndarray, xyz_end: np.ndarray) -> float:
+    # plain dot product rather than np.linalg.norm for a single 3-vector
+    dxyz = xyz_end - xyz_start
+    return float(np.sqrt(dxyz @ dxyz))
+
+
 def assign_xyz(
     neuron_group: NeuronGroup,
     x: np.ndarray,
@@ -187,25 +197,21 @@ def assign_xyz(
 
 def assign_coords(neuron_group: NeuronGroup, coords: Quantity):
     """Assigns x, y, and z coordinates for neuron group from (n, 3) array"""
-    x, y, z = coords.T / mm
-    assign_xyz(neuron_group, x, y, z, mm)
+    # strip unit once, then hand assign_xyz column views of the (n, 3) array
+    xyz = np.reshape(coords / mm, (-1, 3))
+    assign_xyz(neuron_group, xyz[:, 0], xyz[:, 1], xyz[:, 2], mm)
 
 
 def coords_from_xyz(x: Quantity, y: Quantity, z: Quantity) -> Quantity:
     """Create (..., 3) coordinate array from x, y, z arrays (with units)."""
-    # have to add unit back on since it's stripped by vstack
-    return (
-        np.concatenate(
-            [
-                # use [:] to work around VariableView.shape getting parent group shape
-                np.reshape(x / meter, (*x[:].shape, 1)),
-                np.reshape(y / meter, (*y[:].shape, 1)),
-                np.reshape(z / meter, (*z[:].shape, 1)),
-            ],
-            axis=-1,
-        )
-        * meter
-    )
+    # use [:] to work around VariableView.shape getting parent group shape
+    out = np.empty((*x[:].shape, 3))
+    # write each axis straight into the output rather than concatenating copies
+    out[..., 0] = x / meter
+    out[..., 1] = y / meter
+    out[..., 2] = z / meter
+    # add unit back on without copying
+    return Quantity(out, dim=meter.dim)
 
 
 def coords_from_ng(ng: NeuronGroup) -> Quantity:
@@ -214,34 +220,46 @@ def coords_from_ng(ng: NeuronGroup) -> Quantity:
 
 
 def _init_variables(group: Group):
-    for dim_name in ["x", "y", "z"]:
-        if hasattr(group, dim_name):
+    dim_names = ["x", "y", "z"]
+    missing = [dim_name for dim_name in dim_names if not hasattr(group, dim_name)]
+    for dim_name in dim_names:
+        if dim_name not in missing:
             setattr(group, dim_name, 0 * mm)
-        else:
-            if type(group) == NeuronGroup:
-                modify_model_with_eqs(group, f"{dim_name}: meter")
-
-            elif isinstance(group, Subgroup):
-                if not hasattr(group.source, dim_name):
-                    modify_model_with_eqs(group.source, f"{dim_name}: meter")
-                group.variables.add_references(
-                    group.source, list(group.source.variables.keys())
-                )
-                assert dim_name in group.variables
-
-            elif issubclass(type(group), Group):
-                group.variables.add_array(
-                    dim_name,
-                    size=group._N,
-                    dimensions=get_dimensions(meter),
-                    dtype=float,
-                    constant=True,
-                    scalar=False,
-                )
-            else:
-                raise NotImplementedError(
-                    "Coordinate assignment only implemented for brian2.Group objects"
-                )
+    if not missing:
+        return
+
+    # add all missing coordinates in one go, since each model modification
+    # rebuilds the group's equations
+    if type(group) == NeuronGroup:
+        modify_model_with_eqs(group, _coord_eqs(missing))
+
+    elif isinstance(group, Subgroup):
+        missing_in_source = [d for d in missing if not hasattr(group.source, d)]
+        if missing_in_source:
+            modify_model_with_eqs(group.source, _coord_eqs(missing_in_source))
+        group.variables.add_references(
+            group.source, list(group.source.variables.keys())
+        )
+        assert all(dim_name in group.variables for dim_name in missing)
+
+    elif issubclass(type(group), Group):
+        for dim_name in missing:
+            group.variables.add_array(
+                dim_name,
+                size=group._N,
+                dimensions=get_dimensions(meter),
+                dtype=float,
+                constant=True,
+                scalar=False,
+            )
+    else:
+        raise NotImplementedError(
+            "Coordinate assignment only implemented for brian2.Group objects"
+        )
+
+
+def _coord_eqs(dim_names: list[str]) -> str:
+    return "\n".join(f"{dim_name}: meter" for dim_name in dim_names)
 
 
 def concat_coords(*coords: Quantity) -> Quantity:
@@ -108,6 +108,10 @@ class Probe(Recorder, NeoExportable):
 
     def __attrs_post_init__(self):
         self.coords = self.coords.reshape((-1, 3))
+        # store row-major so per-axis reads (xs, ys, zs) stride predictably
+        # rather than inheriting whatever layout the input happened to have
+        if not self.coords.flags.c_contiguous:
+            self.coords = self.coords.copy(order="C")
         if len(self.coords.shape) != 2 or self.coords.shape[1] != 3:
             raise ValueError(
                 "coords must be an n by 3 array (with unit) with x, y, and z"
@@ -161,8 +161,9 @@ class Spiking(Signal, NeoExportable):
     def _i_ng_to_i_probe(self, i_ng, monitor):
         ng = monitor.source
         # assign value of -1 to neurons we aren't recording to filter out
-        i_probe_unfilt = np.array([self.i_probe_by_i_ng.get((ng, k), -1) for k in i_ng])
-        return i_probe_unfilt[i_probe_unfilt != -1].astype(np.uint)
+        return np.array(
+            [self.i_probe_by_i_ng.get((ng, k), -1) for k in i_ng], dtype=int
+        )
 
     def _get_new_spikes(self) -> Tuple[UInt[np.ndarray, "n_spikes"], Quantity]:
         i_probe = np.array([], dtype=np.uint)
@@ -171,8 +172,13 @@ class Spiking(Signal, NeoExportable):
             mon = self._monitors[j]
             spikes_already_seen = self._mon_spikes_already_seen[j]
             i_ng = mon.i[spikes_already_seen:]  # can contain spikes we don't care about
-            i_probe = np.concatenate((i_probe, self._i_ng_to_i_probe(i_ng, mon)))
-            t = unit_safe_cat([t, mon.t[spikes_already_seen:]])
+            i_probe_unfilt = self._i_ng_to_i_probe(i_ng, mon)
+            # filter indices and times together so they stay aligned
+            recorded = i_probe_unfilt != -1
+            i_probe = np.concatenate(
+                (i_probe, i_probe_unfilt[recorded].astype(np.uint))
+            )
+            t = unit_safe_cat([t, mon.t[spikes_already_seen:][recorded]])
             self._mon_spikes_already_seen[j] = mon.num_spikes
 
         return i_probe, t
@@ -313,7 +319,7 @@ class SortedSpiking(Spiking):
         y = np.bincount(i_probe.astype(int))
         # include 0s for upper indices not seen:
         y = np.concatenate([y, np.zeros(len(self.i_probe_by_i_ng) - len(y))])
-        t_samp = self.probe.sim.network.t / ms
+        t_samp = self.probe.sim.network.t
         self._update_saved_vars(t, i_probe, t_samp)
         return (i_probe, t, y)
 
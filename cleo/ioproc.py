@@ -7,11 +7,13 @@ from typing import Tuple
 
 import numpy as np
 from attrs import define, field, fields
-from brian2 import Quantity, ms
+from brian2 import Quantity, ms, second
 from jaxtyping import UInt
 
 from cleo.base import IOProcessor
-from cleo.utilities import unit_safe_append
+
+_SAMPLE_TOL_MS = 1e-6
+"""How close (in ms) a query time must be to the sampling schedule to count as on it"""
 
 
 @define
@@ -25,8 +27,9 @@ class LatencyIOProcessor(IOProcessor):
     one sample at a time to process.
     """
 
-    t_samp: Quantity = field(factory=lambda: [] * ms, init=False, repr=False)
-    """Record of sampling times---each time :meth:`~put_state` is called."""
+    _t_samp_s: np.ndarray = field(factory=lambda: np.empty(64), init=False, repr=False)
+    """Growable backing array for :attr:`t_samp` (in seconds), doubled when full"""
+    _n_samp: int = field(default=0, init=False, repr=False)
 
     sampling: str = field(default="fixed")
     """Sampling scheme: "fixed" or "when idle".
@@ -94,38 +97,66 @@ class LatencyIOProcessor(IOProcessor):
             For invalid `sampling` or `processing` kwargs 
         """
 
+    _next_t_out_ms: float = field(default=np.inf, init=False, repr=False)
+    """Output time (in ms) of the first sample in :attr:`out_buffer`, inf if empty.
+    Kept in sync on push/pop so the per-timestep check is a single float compare."""
+
+    @property
+    def t_samp(self) -> Quantity:
+        """Record of sampling times---each time :meth:`~put_state` is called."""
+        # read-only view on the filled part of the buffer, no copy
+        t_samp_s = self._t_samp_s[: self._n_samp]
+        t_samp_s.flags.writeable = False
+        return Quantity(t_samp_s, dim=second.dim)
+
+    def _append_t_samp(self, t_samp: Quantity):
+        if self._n_samp == len(self._t_samp_s):
+            self._t_samp_s = np.resize(self._t_samp_s, 2 * len(self._t_samp_s))
+        self._t_samp_s[self._n_samp] = t_samp / second
+        self._n_samp += 1
+
     def put_state(self, state_dict: dict, t_samp: Quantity):
-        self.t_samp = unit_safe_append(self.t_samp, t_samp)
+        self._append_t_samp(t_samp)
         out, t_out = self.process(state_dict, t_samp)
-        if self.processing == "serial" and len(self.out_buffer) > 0:
-            prev_t_out = self.out_buffer[-1][1]
+        # local alias: the buffer is looked up once per call rather than per use
+        # (not stored on self, since _base_reset replaces the buffer)
+        out_buffer = self.out_buffer
+        if not out_buffer:
+            self._next_t_out_ms = float(t_out / ms)
+        elif self.processing == "serial":
+            prev_t_out = out_buffer[-1][1]
             # add delay onto the output time of the last computation
             t_out = prev_t_out + t_out - t_samp
-        self.out_buffer.append((out, t_out))
+        out_buffer.append((out, t_out))
         self._needs_off_schedule_sample = False
 
     def get_ctrl_signals(self, t_query):
-        if len(self.out_buffer) == 0:
+        if float(t_query / ms) < self._next_t_out_ms:
             return {}
-        next_out_signal, next_t_out = self.out_buffer[0]
-        if t_query >= next_t_out:
-            self.out_buffer.popleft()
-            return next_out_signal
+        out_buffer = self.out_buffer
+        next_out_signal, _ = out_buffer.popleft()
+        if out_buffer:
+            self._next_t_out_ms = float(out_buffer[0][1] / ms)
         else:
-            return {}
+            self._next_t_out_ms = np.inf
+        return next_out_signal
 
     def _is_currently_idle(self, t_query):
-        return len(self.out_buffer) == 0 or self.out_buffer[0][1] <= t_query
+        return not self.out_buffer or self._next_t_out_ms <= float(t_query / ms)
 
     def is_sampling_now(self, t_query):
-        resid_ms = np.round((t_query % self.sample_period) / ms, 6)
+        # called every timestep, so use plain floats rather than numpy/Brian ops
+        period_ms = float(self.sample_period / ms)
+        t_ms = float(t_query / ms)
+        # compare against the nearest whole number of periods rather than taking
+        # a float modulo, which can land just under a full period
+        n_periods = round(t_ms / period_ms)
+        on_schedule = abs(t_ms - n_periods * period_ms) < _SAMPLE_TOL_MS
         if self.sampling == "fixed":
-            if np.isclose(resid_ms, 0) or np.isclose(
-                resid_ms, np.round(self.sample_period / ms, 6)
-            ):
+            if on_schedule:
                 return True
         elif self.sampling == "when idle":
-            if np.isclose(resid_ms, 0):
+            if on_schedule:
                 if self._is_currently_idle(t_query):
                     self._needs_off_schedule_sample = False
                     return True
@@ -162,8 +193,10 @@ class LatencyIOProcessor(IOProcessor):
         pass
 
     def _base_reset(self):
-        self.t_samp = fields(type(self)).t_samp.default.factory()
+        self._t_samp_s = fields(type(self))._t_samp_s.default.factory()
+        self._n_samp = 0
         self.out_buffer = fields(type(self)).out_buffer.default.factory()
+        self._next_t_out_ms = np.inf
         self._needs_off_schedule_sample = False
 
 
@@ -8,14 +8,18 @@ from typing import Any
 
 import matplotlib as mpl
 import quantities as pq
-from attrs import define, field
+from attrs import define, field, setters
 from brian2 import (
     NeuronGroup,
     Subgroup,
     np,
 )
 from brian2.units import (
+    DimensionMismatchError,
     Quantity,
+    get_dimensions,
+    have_same_dimensions,
+    meter,
     mm,
     mm2,
     mwatt,
@@ -86,36 +90,62 @@ class LightModel(ABC):
         # either shared or per-source targets
         assert target_coords.shape in [(m, n, 3), (1, n, 3), (n, 3), (3,)]
 
+        # strip units from the inputs before anything else so the m x n x 3
+        # subtraction and everything below run on plain arrays, but check them
+        # first, as the subtraction with units would have
+        if not have_same_dimensions(target_coords, source_coords):
+            raise DimensionMismatchError(
+                "Target and source coordinates must have the same units",
+                get_dimensions(target_coords),
+                get_dimensions(source_coords),
+            )
+        target_coords = np.asarray(target_coords / meter)
+        source_coords = np.asarray(source_coords / meter)
         # relative to light source(s)
         rel_coords = target_coords - source_coords.reshape((m, 1, 3))
         assert rel_coords.shape == (m, n, 3)
-        # must use brian2's dot function for matrix multiply to preserve
-        # units correctly.
-        # zc = usf.dot(rel_coords, source_direction)  # mxn distance along cylinder axis
-        #           m x n x 3    m x 1 x 3
-        zc = np.sum(
-            rel_coords * source_direction.reshape((-1, 1, 3)), axis=-1
-        )  # mxn distance along cylinder axis
-        assert zc.shape == (m, n)
-        # just need length (norm) of radius vectors
-        # not using np.linalg.norm because it strips units
-        r = np.sqrt(
-            np.sum(
-                (
-                    rel_coords
-                    #    m x n                 m x 3
-                    # --> m x n x 1             m x 1 x 3
-                    - zc.reshape((m, n, 1)) * source_direction.reshape((-1, 1, 3))
-                )
-                ** 2,
-                axis=-1,
-            )
+        source_direction = np.broadcast_to(
+            np.reshape(source_direction, (-1, 3)), (m, 3)
         )
+        # mxn distance along cylinder axis
+        zc = np.einsum("mnk,mk->mn", rel_coords, source_direction)
+        assert zc.shape == (m, n)
+        # radius from |rel|**2 = r**2 + zc**2 rather than norming the
+        # radial vectors, which would need another m x n x 3 array
+        r2 = np.einsum("mnk,mnk->mn", rel_coords, rel_coords)
+        r2 -= zc**2
+        # clip tiny negatives from rounding for points on the axis
+        r = np.sqrt(np.maximum(r2, 0, out=r2), out=r2)
+        r, zc = r * meter, zc * meter
         assert r.shape == (m, n)
         return r, zc
 
 
-@define
+def _apply_kubelka_munk(T, r, z, S, a, b, buf):
+    """Multiplies T in place by the Kubelka-Munk factor for unitless r and z.
+
+    M = b / (a * sinh(b*S*dist) + b * cosh(b*S*dist)), rewritten with
+    e = exp(-b*S*dist) as 2b*e / ((a+b) - (a-b)*e**2) so only one
+    transcendental is evaluated and nothing overflows at large dist.
+    ``buf`` is scratch space the same shape as T."""
+    e = np.hypot(r, z, out=buf)
+    e *= -b * S
+    np.exp(e, out=e)
+    T *= e
+    T *= 2 * b
+    np.square(e, out=e)
+    e *= -(a - b)
+    e += a + b
+    T /= e
+
+
+def _clear_scalar_params(instance: OpticFiber, attribute, value):
+    """Drops cached derived parameters whenever a model parameter changes"""
+    instance._scalar_params = None
+    return value
+
+
+@define(on_setattr=[setters.convert, setters.validate, _clear_scalar_params])
 class OpticFiber(LightModel):
     """Optic fiber light model from Foutz et al., 2012.
 
@@ -132,6 +162,24 @@ class OpticFiber(LightModel):
     ntis: float = 1.36
     """tissue index of refraction (wavelength/tissue dependent)"""
 
+    _scalar_params: tuple = field(
+        init=False, default=None, repr=False, eq=False, on_setattr=setters.NO_OP
+    )
+    """Unitless (R0, tan(theta_div), S, a, b) derived from the parameters above,
+    computed on first use so they aren't redone for every transmittance call"""
+
+    def _get_scalar_params(self) -> tuple:
+        if self._scalar_params is None:
+            # divergence half-angle of cone
+            theta_div = np.arcsin(self.NAfib / self.ntis)
+            # Kubelka-Munk coefficients
+            a = 1 + self.K / self.S
+            b = np.sqrt(a**2 - 1)
+            self._scalar_params = tuple(
+                float(p) for p in (self.R0 / mm, np.tan(theta_div), self.S * mm, a, b)
+            )
+        return self._scalar_params
+
     def transmittance(
         self,
         source_coords: Quantity,
@@ -146,39 +194,74 @@ class OpticFiber(LightModel):
     def area0(self) -> Quantity:
         return np.pi * self.R0**2
 
-    def _Foutz12_transmittance(self, r, z, scatter=True, spread=True, gaussian=True):
+    def _Foutz12_transmittance(
+        self, r, z, scatter=True, spread=True, gaussian=True, T_threshold=0
+    ):
         """Foutz et al. 2012 transmittance model: Gaussian cone with Kubelka-Munk propagation.
 
-        r and z should be (n_source, n_target) arrays with units"""
+        r and z should be (n_source, n_target) arrays with units.
+        If ``T_threshold`` is given, points below it are set to 0, skipping the
+        scattering term where it can't be reached (useful for visualization)."""
+        # strip units once: Brian's unit-checking overloads are slow on large arrays.
+        # Every factor is then accumulated into T through a single scratch buffer
+        # so no per-term temporaries are allocated.
+        # T is a smooth coefficient in [0, 1], so single precision is plenty and
+        # halves memory traffic; it gets upcast once when stored on synapses.
+        dtype = np.float32
+        r, z = np.broadcast_arrays(
+            np.asarray(r / mm, dtype=dtype), np.asarray(z / mm, dtype=dtype)
+        )
+        R0, tan_theta_div, S, a, b = map(dtype, self._get_scalar_params())
+
+        # no light behind the fiber: skip those points entirely, which also
+        # avoids dividing by a non-positive Rz there
+        ahead = z >= 0
+        all_ahead = ahead.all()
+        if not all_ahead:
+            r, z = r[ahead], z[ahead]
+        T = np.ones(r.shape, dtype=dtype)
+        buf = np.empty(r.shape, dtype=dtype)
 
         if spread:
-            # divergence half-angle of cone
-            theta_div = np.arcsin(self.NAfib / self.ntis)
-            Rz = self.R0 + z * np.tan(
-                theta_div
-            )  # radius as light spreads ("apparent radius" from original code)
-            C = (self.R0 / Rz) ** 2
+            # radius as light spreads ("apparent radius" from original code)
+            Rz = np.multiply(z, tan_theta_div, out=buf)
+            Rz += R0
+            # C = (R0 / Rz)**2
+            np.divide(R0, Rz, out=T)
+            T *= T
         else:
-            Rz = self.R0  # "apparent radius"
-            C = 1
+            Rz = R0  # "apparent radius"
 
         if gaussian:
-            G = 1 / np.sqrt(2 * np.pi) * np.exp(-2 * (r / Rz) ** 2)
-        else:
-            G = 1
+            # G = 1 / sqrt(2pi) * exp(-2 * (r / Rz)**2), overwriting Rz
+            G = np.divide(r, Rz, out=buf)
+            G *= G
+            G *= -2
+            np.exp(G, out=G)
+            G *= dtype(1 / np.sqrt(2 * np.pi))
+            T *= G
 
         if scatter:
-            S = self.S
-            a = 1 + self.K / S
-            b = np.sqrt(a**2 - 1)
-            dist = np.sqrt(r**2 + z**2)
-            M = b / (a * np.sinh(b * S * dist) + b * np.cosh(b * S * dist))
-        else:
-            M = 1
-
-        T = G * C * M
-        T[z < 0] = 0
-        return T
+            if T_threshold > 0:
+                # M <= 1, so T is already an upper bound: only evaluate the
+                # scattering term where the threshold can still be reached
+                reachable = T >= T_threshold
+                T_reach = T[reachable]
+                buf_reach = buf.ravel()[: T_reach.size]
+                _apply_kubelka_munk(
+                    T_reach, r[reachable], z[reachable], S, a, b, buf_reach
+                )
+                T[reachable] = T_reach
+            else:
+                _apply_kubelka_munk(T, r, z, S, a, b, buf)
+        if T_threshold > 0:
+            T[T < T_threshold] = 0
+
+        if all_ahead:
+            return T
+        T_all = np.zeros(ahead.shape, dtype=dtype)
+        T_all[ahead] = T
+        return T_all
 
     def viz_params(
         self,
@@ -203,14 +286,14 @@ class OpticFiber(LightModel):
         """find r and z thresholds for visualization purposes"""
         res_mm = 0.01
         zc = np.arange(20, 0, -res_mm) * mm  # ascending T
-        T = self._Foutz12_transmittance(0 * mm, zc)
+        T = self._Foutz12_transmittance(0 * mm, zc, T_threshold=thresh)
         try:
             zc_thresh = zc[np.searchsorted(T, thresh)]
         except IndexError:  # no points above threshold
             zc_thresh = np.max(zc)
         # look at half the z threshold for the r threshold
         r = np.arange(20, 0, -res_mm) * mm
-        T = self._Foutz12_transmittance(r, zc_thresh / 2)
+        T = self._Foutz12_transmittance(r, zc_thresh / 2, T_threshold=thresh)
         try:
             r_thresh = r[np.searchsorted(T, thresh)]
         except IndexError:  # no points above threshold
@@ -450,10 +533,15 @@ class Light(Stimulator):
         point_clouds = []
         for i in range(self.n):
             idx_to_plot = T[i] >= T_threshold
+            # select surviving points first, then strip units once for all axes
+            # (single precision is plenty for plotting)
+            xyz_to_plot = np.asarray(
+                viz_points[i, idx_to_plot] / axis_scale_unit, dtype=np.float32
+            )
             point_cloud = ax.scatter(
-                viz_points[i, idx_to_plot, 0] / axis_scale_unit,
-                viz_points[i, idx_to_plot, 1] / axis_scale_unit,
-                viz_points[i, idx_to_plot, 2] / axis_scale_unit,
+                xyz_to_plot[:, 0],
+                xyz_to_plot[:, 1],
+                xyz_to_plot[:, 2],
                 c=T[i, idx_to_plot],
                 cmap=self._alpha_cmap_for_wavelength(intensity),
                 vmin=0,
@@ -216,7 +216,7 @@ def plot_spectra(
 
         lambdas_new = np.linspace(lambda_min, lambda_max, 100)
         epsilons_new = ldd.spectrum_interpolator(lambdas, epsilons, lambdas_new)
-        c_points = [wavelength_to_rgb(l) for l in lambdas * nmeter]
+        c_points = wavelength_to_rgb(lambdas * nmeter)
         c_line = wavelength_to_rgb(lambdas[np.argmax(epsilons)] * nmeter)
         ax.plot(lambdas_new, epsilons_new, c=c_line, label=ldd.name)
         ax.scatter(lambdas, epsilons, marker="o", s=50, color=c_points)
@@ -5,9 +5,10 @@ under the hood when interacting devices are injected (e.g., light and opsin)."""
 from __future__ import annotations
 
 from typing import Tuple
+from weakref import WeakKeyDictionary, ref
 
 from attrs import define, field
-from brian2 import NeuronGroup, Subgroup, Synapses
+from brian2 import NeuronGroup, Quantity, Subgroup, Synapses
 from brian2.units.allunits import joule, kgram, meter, meter2, second
 
 from cleo.coords import coords_from_ng
@@ -19,7 +20,8 @@ class DeviceInteractionRegistry:
     """Facilitates the creation and maintenance of 'neurons' and 'synapses'
     implementing many-to-many light-opsin/indicator relationships"""
 
-    sim: "CLSimulator" = field()
+    _sim_ref: ref = field(converter=ref, alias="sim")
+    """Weak reference to the simulator, so :attr:`registries` doesn't keep it alive"""
 
     subgroup_idx_for_light: dict["Light", slice] = field(factory=dict, init=False)
     """Maps light to its indices in the :attr:`light_source_ng`"""
@@ -58,6 +60,24 @@ class DeviceInteractionRegistry:
     brian_objects: set = field(factory=set, init=False)
     """Stores all Brian objects created (and injected into the network) by this registry"""
 
+    _coords_cache: dict[NeuronGroup, Quantity] = field(factory=dict, init=False)
+    """Maps neuron group to its (n, 3) coordinates, so they are only gathered
+    once no matter how many light/light-dependent device pairs are connected"""
+
+    _epsilon_cache: dict[Tuple["LightDependent", float], float] = field(
+        factory=dict, init=False
+    )
+    """Maps (light-dependent device, wavelength in meters) to its relative
+    sensitivity, so spectra are only interpolated once per pair"""
+
+    _ephoton_cache: dict[float, Quantity] = field(factory=dict, init=False)
+    """Maps wavelength in meters to photon energy"""
+
+    @property
+    def sim(self) -> "CLSimulator":
+        """The simulator this registry belongs to"""
+        return self._sim_ref()
+
     def register(self, device: "InterfaceDevice", ng: NeuronGroup) -> None:
         """Registers a device injection with the registry.
 
@@ -93,7 +113,7 @@ class DeviceInteractionRegistry:
         ValueError
             if the connection has already been made
         """
-        epsilon = ldd.epsilon(light.wavelength)
+        epsilon = self._epsilon_for(ldd, light.wavelength)
         if epsilon == 0:
             return
 
@@ -103,17 +123,37 @@ class DeviceInteractionRegistry:
 
         i_source = self.subgroup_idx_for_light[light]
         light_prop_syn.epsilon[i_source, :] = epsilon
-        light_prop_syn.T[i_source, :] = light.transmittance(coords_from_ng(ng)).ravel()
-        # fmt: off
-        # Ephoton = h*c/lambda
-        light_prop_syn.Ephoton[i_source, :] = (
-            6.63e-34 * meter2 * kgram / second
-            * 2.998e8 * meter / second
-            / light.wavelength
-        )
-        # fmt: on
+        # light aggregator neurons only cover the neurons expressing the device
+        # (e.g., with p_expression < 1), so only compute T at their coordinates
+        coords = self._coords_for_ng(light_prop_syn.target)
+        light_prop_syn.T[i_source, :] = light.transmittance(coords).ravel()
+        light_prop_syn.Ephoton[i_source, :] = self._ephoton_for(light.wavelength)
         self.connections.add((light, ldd, ng))
 
+    def _coords_for_ng(self, ng: NeuronGroup) -> Quantity:
+        if ng not in self._coords_cache:
+            self._coords_cache[ng] = coords_from_ng(ng)
+        return self._coords_cache[ng]
+
+    def _epsilon_for(self, ldd: "LightDependent", wavelength: Quantity) -> float:
+        key = (ldd, float(wavelength / meter))
+        if key not in self._epsilon_cache:
+            self._epsilon_cache[key] = ldd.epsilon(wavelength)
+        return self._epsilon_cache[key]
+
+    def _ephoton_for(self, wavelength: Quantity) -> Quantity:
+        key = float(wavelength / meter)
+        if key not in self._ephoton_cache:
+            # fmt: off
+            # Ephoton = h*c/lambda
+            self._ephoton_cache[key] = (
+                6.63e-34 * meter2 * kgram / second
+                * 2.998e8 * meter / second
+                / wavelength
+            )
+            # fmt: on
+        return self._ephoton_cache[key]
+
     def _add_brian_object(self, obj):
         self.brian_objects.add(obj)
         self.sim.network.add(obj)
@@ -144,9 +184,7 @@ class DeviceInteractionRegistry:
 
     def register_ldd(self, ldd: "LightDependent", ng: NeuronGroup):
         """Connects lights previously injected into this neuron group to this light-dependent device"""
-        if ng not in self.ldds_for_ng:
-            self.ldds_for_ng[ng] = set()
-        self.ldds_for_ng[ng].add(ldd)
+        self.ldds_for_ng.setdefault(ng, set()).add(ldd)
         prev_injct_lights = self.lights_for_ng.get(ng, set())
         for light in prev_injct_lights:
             self.connect_light_to_ldd_for_ng(light, ldd, ng)
@@ -184,9 +222,7 @@ class DeviceInteractionRegistry:
     def register_light(self, light: "Light", ng: NeuronGroup):
         """Connects light to light-dependent devices already injected into this neuron group"""
         # create new connections for this light
-        if ng not in self.lights_for_ng:
-            self.lights_for_ng[ng] = set()
-        self.lights_for_ng[ng].add(light)
+        self.lights_for_ng.setdefault(ng, set()).add(light)
         prev_injct_ldds = self.ldds_for_ng.get(ng, set())
         for ldd in prev_injct_ldds:
             self.connect_light_to_ldd_for_ng(light, ldd, ng)
@@ -197,8 +233,11 @@ class DeviceInteractionRegistry:
         return self.light_source_ng[i]
 
 
-registries: dict["CLSimulator", DeviceInteractionRegistry] = {}
-"""Maps simulator to its registry"""
+registries: WeakKeyDictionary["CLSimulator", DeviceInteractionRegistry] = (
+    WeakKeyDictionary()
+)
+"""Maps simulator to its registry. Entries are dropped once the simulator
+is garbage-collected."""
 
 
 def registry_for_sim(sim: "CLSimulator") -> DeviceInteractionRegistry:
@@ -1,6 +1,7 @@
 """Assorted utilities for developers."""
 import warnings
 from collections.abc import MutableMapping
+from typing import Union
 
 import brian2.only as b2
 import neo
@@ -99,6 +100,25 @@ def get_orth_vectors_for_V(V):
     return W1.squeeze(), W2.squeeze()
 
 
+def _orth_basis_for_V(V):
+    """Closed-form alternative to :func:`get_orth_vectors_for_V`, for when only
+    some orthonormal basis is needed, not a particular orientation of it.
+
+    Uses the branchless method of Duff et al., 2017, with W1, W2, V forming a
+    right-handed frame. Probe layouts keep using the QR-based vectors, which
+    are oriented differently for axes other than z."""
+    V = np.reshape(V, (-1, 3))
+    V = V / np.linalg.norm(V, axis=-1, keepdims=True)
+    x, y, z = V.T
+    sign = np.copysign(1.0, z)
+    a = -1 / (sign + z)
+    b = x * y * a
+    W1 = np.stack([b, sign + y * y * a, -y], axis=-1)
+    W2 = -np.stack([1 + sign * x * x * a, sign * b, -sign * x], axis=-1)
+    assert W1.shape == W2.shape == V.shape
+    return W1.squeeze(), W2.squeeze()
+
+
 def xyz_from_rθz(rs, thetas, zs, xyz_start, xyz_end):
     """Convert from cylindrical to Cartesian coordinates."""
     # not using np.linalg.norm because it strips units
@@ -110,33 +130,34 @@ def xyz_from_rθz(rs, thetas, zs, xyz_start, xyz_end):
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         c = (xyz_end - xyz_start) / cyl_length  # unit vector in direction of cylinder
-    # in case cyl_length is 0, producing nans
     assert c.shape in [(m, 3), (3,)]
-    if c.shape == (m, 3):
-        assert cyl_length.shape == (m, 1)
-        c[cyl_length.ravel() == 0] = [0, 0, 1]
-    elif c.shape == (3,):
-        c[:] = [0, 0, 1]
-
-    r1, r2 = get_orth_vectors_for_V(c)
-
-    def r_unit_vecs(thetas):
-        cosines = np.reshape(np.cos(thetas), (len(thetas), 1))
-        sines = np.reshape(np.sin(thetas), (len(thetas), 1))
-        # add axis for broadcasting so result is nx3
-        cosines = np.cos(thetas)[..., np.newaxis]
-        sines = np.sin(thetas)[..., np.newaxis]
-        return r1.reshape((m, 1, 3)) * cosines + r2.reshape((m, 1, 3)) * sines
-
-    coords = (
-        xyz_start.reshape((m, 1, 3))
-        + c.reshape((m, 1, 3)) * zs.reshape((1, n, 1))
-        + rs.reshape((1, n, 1)) * r_unit_vecs(thetas)
-    )
+    c = c.reshape((m, 3))
+    # in case cyl_length is 0, producing nans
+    c[cyl_length.ravel() == 0] = [0, 0, 1]
+
+    # (m, 3, 3) orthonormal basis per cylinder: two radial vectors, then the axis
+    r1, r2 = _orth_basis_for_V(c)
+    basis = np.stack([r1.reshape((m, 3)), r2.reshape((m, 3)), c], axis=-2)
+    # (n, 3) points in each cylinder's own frame, in base units since matmul
+    # drops them; they are put back on at the end, so check them here
+    for q in (rs, zs):
+        if not b2.have_same_dimensions(q, xyz_start):
+            raise b2.DimensionMismatchError(
+                "Cylinder coordinates must have the same units as the endpoints",
+                b2.get_dimensions(q),
+                b2.get_dimensions(xyz_start),
+            )
+    local = np.empty((n, 3))
+    local[:, 0] = np.asarray(rs) * np.cos(thetas)
+    local[:, 1] = np.asarray(rs) * np.sin(thetas)
+    local[:, 2] = np.asarray(zs)
+    # (n, 3) @ (m, 3, 3) -> (m, n, 3): the only full-size temporary
+    coords = local @ basis
+    coords += np.asarray(xyz_start).reshape((m, 1, 3))
     assert coords.shape == (m, n, 3)
+    if isinstance(xyz_start, Quantity):
+        coords = Quantity(coords, dim=xyz_start.dim)
     return coords[..., 0], coords[..., 1], coords[..., 2]
-    # coords = coords.reshape((m * n), 3)
-    # return coords[:, 0], coords[:, 1], coords[:, 2]
 
 
 def uniform_cylinder_rθz(n, rmax, zmax):
@@ -242,17 +263,42 @@ def modify_model_with_eqs(neuron_group, eqs_to_add):
 
 def wavelength_to_rgb(
     wavelength: Quantity, gamma: float = 0.8
-) -> tuple[float, float, float]:
+) -> Union[tuple[float, float, float], np.ndarray]:
     """taken from http://www.noah.org/wiki/Wavelength_to_RGB_in_Python
     This converts a given wavelength of light to an
     approximate RGB color value. The wavelength must be given
     in nanometers in the range from 380 nm through 750 nm
     (789 THz through 400 THz).
 
+    Vectorized over arrays of wavelengths: a scalar wavelength gives an
+    (R, G, B) tuple, while an array gives an (..., 3) array.
+
     Based on code by Dan Bruton
     http://www.physics.sfasu.edu/astro/color/spectra.html
     """
-    wavelength /= b2.nmeter
+    w = wavelength / b2.nmeter
+    # whole-nm wavelengths (up to float error from the unit conversion) with
+    # the default gamma are read from the precomputed table
+    use_lut = gamma == _RGB_LUT_GAMMA
+    # device colors are looked up one at a time, so keep scalars off the
+    # array machinery below
+    if np.ndim(w) == 0:
+        w = float(w)
+        if use_lut and 380 <= w <= 750:
+            w_nm = round(w)
+            if abs(w - w_nm) < _RGB_LUT_TOL_NM:
+                return _RGB_LUT_TUPLES[w_nm - 380]
+        return _wavelength_to_rgb_scalar(w, gamma)
+
+    w = np.clip(np.asarray(w, dtype=float), 380.0, 750.0)
+    w_nm = np.rint(w)
+    if use_lut and np.all(np.abs(w - w_nm) < _RGB_LUT_TOL_NM):
+        return _RGB_LUT[w_nm.astype(int) - 380]
+    return _wavelength_to_rgb_array(w, gamma)
+
+
+def _wavelength_to_rgb_scalar(wavelength: float, gamma: float) -> tuple:
+    """RGB tuple for a single wavelength in nm"""
     if wavelength < 380:
         wavelength = 380.0
     if wavelength > 750:
@@ -290,6 +336,38 @@ def wavelength_to_rgb(
     return (R, G, B)
 
 
+def _wavelength_to_rgb_array(w: np.ndarray, gamma: float) -> np.ndarray:
+    """(..., 3) RGB array for wavelengths already in nm and clipped to 380--750"""
+    zeros, ones = np.zeros_like(w), np.ones_like(w)
+    # every branch is evaluated over the whole array, so ignore the nans
+    # from raising out-of-range (negative) bases to gamma; np.select drops them
+    with np.errstate(invalid="ignore"):
+        attenuation_lo = 0.3 + 0.7 * (w - 380) / (440 - 380)
+        attenuation_hi = 0.3 + 0.7 * (750 - w) / (750 - 645)
+        R_lo = ((-(w - 440) / (440 - 380)) * attenuation_lo) ** gamma
+        B_lo = (1.0 * attenuation_lo) ** gamma
+        G_rise = ((w - 440) / (490 - 440)) ** gamma
+        B_fall = (-(w - 510) / (510 - 490)) ** gamma
+        R_rise = ((w - 510) / (580 - 510)) ** gamma
+        G_fall = (-(w - 645) / (645 - 580)) ** gamma
+        R_hi = (1.0 * attenuation_hi) ** gamma
+
+    # boundaries are shared by neighboring intervals, but the formulas agree
+    # there, so the first matching interval is taken as in the original
+    intervals = [w <= 440, w <= 490, w <= 510, w <= 580, w <= 645, w <= 750]
+    R = np.select(intervals, [R_lo, zeros, zeros, R_rise, ones, R_hi])
+    G = np.select(intervals, [zeros, G_rise, ones, ones, G_fall, zeros])
+    B = np.select(intervals, [B_lo, ones, B_fall, zeros, zeros, zeros])
+    return np.stack([R, G, B], axis=-1)
+
+
+_RGB_LUT_GAMMA = 0.8
+_RGB_LUT = _wavelength_to_rgb_array(np.arange(380.0, 751.0), _RGB_LUT_GAMMA)
+"""(371, 3) RGB values for each whole nm from 380 to 750 nm, at the default gamma"""
+_RGB_LUT_TUPLES = [tuple(float(c) for c in rgb) for rgb in _RGB_LUT]
+_RGB_LUT_TOL_NM = 1e-6
+
+
 def brian_safe_name(name: str) -> str:
     return (
         name.replace(" ", "_")
@@ -26,6 +26,10 @@ def test_Probe():
     assert probe.n == 1
     probe = Probe([[0, 0, 0], [1, 1, 1]] * mm)
     assert probe.n == 2
+    # column-major input is stored row-major, keeping units
+    probe = Probe(np.asfortranarray([[0, 0, 0], [1, 1, 1]]) * mm)
+    assert probe.coords.flags.c_contiguous
+    assert np.all(probe.xs == [0, 1] * mm)
     with pytest.raises(ValueError):
         Probe([0, 0] * mm)
     with pytest.raises(ValueError):
@@ -177,6 +181,27 @@ def test_poly3_shank_coords():
     assert not np.any(np.all(coords == coords2, axis=1))
 
 
+def test_shank_coords_angled():
+    # layouts for directions other than straight down are pinned, since they
+    # depend on the orientation of the vectors orthogonal to the shank
+    coords = poly2_shank_coords(1 * mm, 4, 50 * umeter, direction=(0, 1, 0))
+    assert np.allclose(
+        coords / umeter,
+        [[-25, 0, 0], [25, 1000 / 3, 0], [-25, 2000 / 3, 0], [25, 1000, 0]],
+    )
+    # flat in the xy plane
+    coords = tetrode_shank_coords(1 * mm, 1, direction=(1, 1, 0))
+    assert np.allclose(
+        coords / umeter,
+        [[-12.5, -12.5, 0], [12.5, -12.5, 0], [-12.5, 12.5, 0], [12.5, 12.5, 0]],
+    )
+    coords = poly3_shank_coords(1 * mm, 3, 30 * umeter, direction=(1, 0, 1))
+    offset = 30 / np.sqrt(2)
+    assert np.allclose(
+        coords / umeter, [[offset, 0, -offset], [0, 0, 0], [-offset, 0, offset]]
+    )
+
+
 def test_concat_tile_coords():
     poly2 = poly2_shank_coords(0.5 * mm, 16, 50 * umeter)
     # tiling 3 shanks over .4 mm creates a .2 mm intershank distance
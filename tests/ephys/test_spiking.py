@@ -1,7 +1,8 @@
 """Tests for ephys.spiking module"""
 import numpy as np
+import pytest
 import quantities as pq
-from brian2 import Network, SpikeGeneratorGroup, mm, ms
+from brian2 import Network, Quantity, SpikeGeneratorGroup, mm, ms
 
 import cleo
 import cleo.utilities
@@ -9,6 +10,16 @@ from cleo import CLSimulator
 from cleo.ephys import MultiUnitSpiking, Probe, SortedSpiking
 from cleo.ioproc import RecordOnlyProcessor
 
+_zeros_mm_cache = {}
+
+
+def _zeros_mm(N):
+    """Shared (read-only) N zero coordinates, so each test group doesn't rebuild them"""
+    if N not in _zeros_mm_cache:
+        # zero in any scale, so wrap directly instead of multiplying by mm
+        _zeros_mm_cache[N] = Quantity(np.zeros(N), dim=mm.dim)
+    return _zeros_mm_cache[N]
+
 
 def _spike_generator_group(z_coords_mm, indices=None, times_ms=None, **kwparams):
     N = len(z_coords_mm)
@@ -18,12 +29,18 @@ def _spike_generator_group(z_coords_mm, indices=None, times_ms=None, **kwparams)
     sgg = SpikeGeneratorGroup(N, indices, times_ms * ms, **kwparams)
     for var in ["x", "y", "z"]:
         sgg.add_attribute(var)
-    sgg.x = np.zeros(N) * mm
-    sgg.y = np.zeros(N) * mm
+    sgg.x = _zeros_mm(N)
+    sgg.y = _zeros_mm(N)
     sgg.z = z_coords_mm * mm
     return sgg
 
 
+def _spikes_sampled_at(spike_signal, t_samp_ms):
+    """Recorded indices and spike times from the sample(s) taken at t_samp_ms"""
+    in_sample = np.isin(np.round(spike_signal.t_samp / ms, 6), t_samp_ms)
+    return spike_signal.i[in_sample], spike_signal.t[in_sample]
+
+
 def test_MUS_multiple_contacts(rand_seed):
     cleo.utilities.set_seed(rand_seed)
     # raster of test spikes: each character is 1-ms bin
@@ -51,42 +68,37 @@ def test_MUS_multiple_contacts(rand_seed):
     i, t, y = mus.get_state()
     assert len(i) == len(t) == y.sum() == 0
 
-    sim.run(1 * ms)  # 1 ms
-    i, t, y = mus.get_state()
-    assert len(i) == len(t) == y.sum()
+    # sample every ms in a single run, then check what each sample picked up
+    sim.set_io_processor(RecordOnlyProcessor(sample_period=1 * ms))
+    sim.run(11 * ms)
+
+    i, t = _spikes_sampled_at(mus, 1)
     assert (0 in i) and (0.9 * ms in t)
 
-    sim.run(1 * ms)  # 2 ms
-    i, t, y = mus.get_state()
-    assert len(i) == len(t) == y.sum()
+    i, t = _spikes_sampled_at(mus, 2)
     assert len(i) == 0 and len(t) == 0
 
-    sim.run(1 * ms)  # 3 ms
-    i, t, y = mus.get_state()
-    assert len(i) == len(t) == y.sum()
+    i, t = _spikes_sampled_at(mus, 3)
     assert (0 in i) and (2.1 * ms in t)
 
-    sim.run(1 * ms)  # 4 ms
-    i, t, y = mus.get_state()
-    assert len(i) == len(t) == y.sum()
+    i, t = _spikes_sampled_at(mus, 4)
     # should pick up 2 spikes on first and 1 or 2 on second channel
     assert 1 in i and len(i) >= 3
     assert 3.5 * ms in t
 
-    sim.run(2 * ms)  # to 6 ms
-    # sim.get_state() nested dict is what will be passed to IO processor
-    i, t, y = sim.get_state()["Probe"]["mus"]
-    assert len(i) == len(t) == y.sum()
+    i, t = _spikes_sampled_at(mus, [5, 6])
     assert (0 in i) and (1 in i) and len(i) >= 7
     assert all(t_i in (t / ms).round(2) for t_i in [4.1, 4.9, 5.1, 5.3, 5.5])
 
     # should have picked up at least one but not all spikes outside perfect radius
-    assert len(mus.i) > 12
-    sim.run(5 * ms)  # to 11 ms
+    assert len(_spikes_sampled_at(mus, range(7))[0]) > 12
     # each channel should have picked up not all spikes
     assert np.sum(mus.i == 0) < len(indices)
     assert np.sum(mus.i == 1) < len(indices)
 
+    # sim.get_state() nested dict is what will be passed to IO processor
+    i, t, y = sim.get_state()["Probe"]["mus"]
+    assert len(i) == len(t) == y.sum()
     assert len(mus.i) == len(mus.t) == len(mus.t_samp)
 
 
@@ -116,8 +128,8 @@ def test_MUS_multiple_groups():
     assert np.all(mus.t_samp == 10 * ms)
 
 
-def test_MUS_reset():
-    _test_reset(MultiUnitSpiking)
+def test_MUS_reset(reset_sim):
+    _test_reset(reset_sim, MultiUnitSpiking)
 
 
 def test_SortedSpiking():
@@ -147,23 +159,23 @@ def test_SortedSpiking():
     # injecting sgg0 before sgg1 needed to predict i_eg
     sim.inject(probe, sgg0, sgg1)
 
-    sim.run(3 * ms)  # 3 ms
-    i, t, y = sim.get_state()["Probe"]["ss"]
+    # sample every ms in a single run, then check what each sample picked up
+    sim.set_io_processor(RecordOnlyProcessor(sample_period=1 * ms))
+    sim.run(6 * ms)
+
+    i, t = _spikes_sampled_at(ss, [1, 2, 3])
     assert all(i == [2, 2])
-    assert len(i) == len(t) == y.sum()
+    # times line up with indices despite out-of-range neuron 2 spiking meanwhile
+    assert np.allclose(t / ms, [0.9, 2.1])
 
-    sim.run(1 * ms)  # 4 ms
-    i, t, y = ss.get_state()
+    i, _ = _spikes_sampled_at(ss, 4)
     assert all(i == [2, 3])
-    assert len(i) == len(t) == y.sum()
 
-    sim.run(1 * ms)  # 5 ms
-    i, t, y = ss.get_state()
+    i, _ = _spikes_sampled_at(ss, 5)
     assert all(i == [3, 5])
-    assert len(i) == len(t) == y.sum()
 
-    sim.run(1 * ms)  # 6 ms
-    i, t, y = ss.get_state()
+    # sim.get_state() nested dict is what will be passed to IO processor
+    i, t, y = sim.get_state()["Probe"]["ss"]
     assert all(i == [2, 3, 5])
     assert len(i) == len(t) == y.sum()
 
@@ -171,21 +183,33 @@ def test_SortedSpiking():
         assert i not in ss.i
 
     assert ss.t.shape == ss.i.shape == ss.t_samp.shape
-    assert np.all(np.in1d(ss.t_samp, [3, 4, 5, 6]))
+    assert np.all(np.in1d(ss.t_samp / ms, [1, 2, 3, 4, 5, 6]))
 
 
-def _test_reset(spike_signal_class):
+@pytest.fixture(scope="module")
+def reset_sim():
+    """One simulator, with each spike signal type on the same probe, built once
+    for the reset tests, which restore it via sim.reset() before use"""
     sgg = _spike_generator_group([0], period=1 * ms)
-    net = Network(sgg)
-    sim = CLSimulator(net)
-    spike_signal = spike_signal_class(
-        name="spikes",
-        r_perfect_detection=0.3 * mm,
-        r_half_detection=0.75 * mm,
-    )
-    probe = Probe([[0, 0, 0]] * mm, [spike_signal], save_history=True)
+    sim = CLSimulator(Network(sgg))
+    signals = {
+        signal_class: signal_class(
+            name=signal_class.__name__,
+            r_perfect_detection=0.3 * mm,
+            r_half_detection=0.75 * mm,
+        )
+        for signal_class in (MultiUnitSpiking, SortedSpiking)
+    }
+    probe = Probe([[0, 0, 0]] * mm, list(signals.values()), save_history=True)
     sim.inject(probe, sgg)
     sim.set_io_processor(RecordOnlyProcessor(sample_period=1 * ms))
+    return sim, signals
+
+
+def _test_reset(reset_sim, spike_signal_class):
+    sim, signals = reset_sim
+    sim.reset()
+    spike_signal = signals[spike_signal_class]
     assert len(spike_signal.i) == 0
     assert len(spike_signal.t) == 0
     sim.run(3.1 * ms)
@@ -196,8 +220,8 @@ def _test_reset(spike_signal_class):
     assert len(spike_signal.t) == 0
 
 
-def test_SortedSpiking_reset():
-    _test_reset(SortedSpiking)
+def test_SortedSpiking_reset(reset_sim):
+    _test_reset(reset_sim, SortedSpiking)
 
 
 def _test_spiking_to_neo(spike_signal_class):
@@ -1,7 +1,19 @@
 import neo
 import pytest
 import quantities as pq
-from brian2 import Network, NeuronGroup, asarray, mm, mm2, ms, mwatt, nmeter, np, um
+from brian2 import (
+    DimensionMismatchError,
+    Network,
+    NeuronGroup,
+    asarray,
+    mm,
+    mm2,
+    ms,
+    mwatt,
+    nmeter,
+    np,
+    um,
+)
 
 import cleo
 from cleo.light import GaussianEllipsoid, KoehlerBeam, Light, LightModel, fiber473nm
@@ -101,6 +113,43 @@ def test_OpticFiber():
     assert np.all(T == 0)
 
 
+def test_OpticFiber_param_change():
+    source_coords = (0, 0, 0) * mm
+    target_coords = np.random.rand(10, 3) * mm
+    direction = (0, 0, 1)
+    fiber = fiber473nm()
+    fiber.transmittance(source_coords, direction, target_coords)
+    # changing a parameter after use must not reuse stale derived values
+    fiber.R0 = 0.2 * mm
+    fiber.S = 5 / mm
+    T = fiber.transmittance(source_coords, direction, target_coords)
+    T_fresh = fiber473nm(R0=0.2 * mm, S=5 / mm).transmittance(
+        source_coords, direction, target_coords
+    )
+    assert np.allclose(T, T_fresh)
+
+
+@pytest.mark.parametrize("T_threshold", [1e-3, 1e-2, 1e-1])
+def test_Foutz12_transmittance_threshold(T_threshold):
+    rng = np.random.default_rng(0)
+    # includes points behind the fiber (z < 0)
+    r = rng.uniform(0, 2, (3, 2000)) * mm
+    z = rng.uniform(-0.5, 3, (3, 2000)) * mm
+    fiber = fiber473nm()
+    T = fiber._Foutz12_transmittance(r, z)
+    T_thresh = fiber._Foutz12_transmittance(r, z, T_threshold=T_threshold)
+    above = T >= T_threshold
+    assert np.any(above) and np.any(~above)
+    assert np.array_equal(T_thresh[above], T[above])
+    assert np.all(T_thresh[~above] == 0)
+    assert np.all(T_thresh[z < 0] == 0)
+
+
+def test_transmittance_checks_units():
+    with pytest.raises(DimensionMismatchError):
+        fiber473nm().transmittance((0, 0, 0) * mm, (0, 0, 1), np.array([0, 0, 0.5]))
+
+
 def test_reset():
     light = Light(light_model=fiber473nm())
     assert light.value == 0
@@ -37,6 +37,12 @@ def test_cylinder_random():
     )
     # none exactly on the axis (theoretically possible but highly improbable)
     assert not np.any(ng.z == ng.x / 2 + ng.y / 2)
+    # all within the cylinder along the (1, 1, 1) axis
+    rel = coords.coords_from_ng(ng) / mm - 1
+    along_axis = rel @ np.ones(3) / np.sqrt(3)
+    assert np.all((along_axis >= 0) & (along_axis <= np.sqrt(3)))
+    r = np.sqrt(np.sum(rel**2, axis=-1) - along_axis**2)
+    assert np.all(r <= 1 + 1e-9)
 
     coords.assign_coords_rand_cylinder(ng, (0, 0, 0), (0, 0, 1), 1)
     # none past the ends
@@ -82,6 +88,16 @@ def test_arbitrary_coords():
     coords.assign_xyz(ng, np.array([0, 1, 2]), np.array([3, 4, 5]), np.array([6, 7, 8]))
 
 
+def test_assign_coords():
+    ng = NeuronGroup(4, "v=0: volt")
+    xyz = np.arange(12).reshape((4, 3)) * mm
+    coords.assign_coords(ng, xyz)
+    assert np.all(ng.x == xyz[:, 0])
+    assert np.all(ng.y == xyz[:, 1])
+    assert np.all(ng.z == xyz[:, 2])
+    assert np.all(coords.coords_from_ng(ng) == xyz)
+
+
 def test_init_vars_for_subgroup():
     ng = NeuronGroup(10, "v=0: volt")
     sg1 = ng[:8]
@@ -33,8 +33,9 @@ class MyLIOP(LatencyIOProcessor):
 def _test_LatencyIOProcessor(myLIOP, t, sampling, inputs, outputs):
     expected_out = [{} if out is None else {"out": out} for out in outputs]
     for i in range(len(t)):
-        assert myLIOP.is_sampling_now(t[i]) == sampling[i]
-        if myLIOP.is_sampling_now(t[i]):
+        is_sampling = myLIOP.is_sampling_now(t[i])
+        assert is_sampling == sampling[i]
+        if is_sampling:
             myLIOP.put_state({"in": inputs[i]}, t[i])
         assert myLIOP.get_stim_values(t[i]) == expected_out[i]
     assert myLIOP.count == np.sum(sampling)
@@ -101,6 +102,16 @@ def test_LatencyIOProcessor_wait_parallel():
     _test_LatencyIOProcessor(myLIOP, t, sampling, inputs, outputs)
 
 
+@pytest.mark.parametrize("sample_period_ms", [0.1, 0.3, 1 / 3])
+def test_LatencyIOProcessor_sampling_schedule(sample_period_ms):
+    myLIOP = MyLIOP(sample_period_ms * ms)
+    dt_ms = sample_period_ms / 4
+    # every 4th step should be sampled, despite float error in the times
+    for i in range(2000):
+        t = round(i * dt_ms, 6) * ms
+        assert myLIOP.is_sampling_now(t) == (i % 4 == 0)
+
+
 def test_sim_LIOP_reset():
     sim = cleo.CLSimulator(Network())
     liop = MyLIOP(1 * ms)
@@ -112,6 +123,13 @@ def test_sim_LIOP_reset():
     sim.reset()
     assert liop.count == liop.count_no_input == 0
     assert len(liop.out_buffer) == 0
+    assert len(liop.t_samp) == 0
+    # run past the initial capacity of the sample time record
+    sim.run(100 * ms)
+    assert np.allclose(liop.t_samp / ms, np.arange(100))
+    # the record can't be modified through the returned view
+    with pytest.raises(ValueError):
+        liop.t_samp[0] = 5 * ms
 
 
 class SampleCounter(cleo.IOProcessor):
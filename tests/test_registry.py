@@ -1,12 +1,15 @@
+import gc
 import warnings
+import weakref
+
 import pytest
 from brian2 import Network, NeuronGroup, mm, mm2, ms, mV, mwatt, nmeter, np, umeter
 
 from cleo import CLSimulator
-from cleo.coords import assign_coords_grid_rect_prism
+from cleo.coords import assign_coords_grid_rect_prism, coords_from_ng
 from cleo.light import Light, fiber473nm
 from cleo.opto import Opsin, chr2_4s, vfchrimson_4s
-from cleo.registry import registry_for_sim
+from cleo.registry import registries, registry_for_sim
 
 
 @pytest.fixture
@@ -109,6 +112,25 @@ def test_light_opsin_interaction(sim_ng1_ng2, ops1, ops2, coords):
     assert np.all(ng2.v > ng1.v)
 
 
+def test_light_partial_expression(sim_ng1_ng2, ops1):
+    sim, ng1, _ = sim_ng1_ng2
+    light = Light(coords=(0, 0, 0) * mm, light_model=fiber473nm())
+    i_targets = [0, 3, 4, 10]
+    sim.inject(ops1, ng1, i_targets=i_targets)
+    sim.inject(light, ng1)
+
+    light_prop_syn = registry_for_sim(sim).light_prop_syns[(ops1, ng1)]
+    assert len(light_prop_syn) == len(i_targets)
+    T_expected = light.transmittance(coords_from_ng(ng1)[i_targets]).ravel()
+    assert np.allclose(light_prop_syn.T, T_expected)
+
+    light.update(10 * mwatt / mm2)
+    sim.run(0.3 * ms)
+    expressing = np.isin(np.arange(ng1.N), i_targets)
+    assert np.all(ng1.v[expressing] > -70 * mV)
+    assert np.all(ng1.v[~expressing] == -70 * mV)
+
+
 @pytest.mark.slow
 def test_multi_channel(sim_ng1_ng2, ops1):
     sim, ng1, _ = sim_ng1_ng2
@@ -220,5 +242,17 @@ def test_multi_light_opsin(sim_ng1_ng2):
     assert np.all(ng1.v == -70 * mV)
 
 
+def test_registry_does_not_keep_sim_alive():
+    sim = CLSimulator(Network())
+    registry = registry_for_sim(sim)
+    assert registry.sim is sim
+    assert registry_for_sim(sim) is registry
+    sim_ref = weakref.ref(sim)
+    del sim
+    gc.collect()
+    assert sim_ref() is None
+    assert registry not in registries.values()
+
+
 if __name__ == "__main__":
     pytest.main(["-s", __file__])
@@ -1,6 +1,16 @@
+import numpy as np
 import pytest
+from brian2 import DimensionMismatchError, mm, nmeter
 
-from cleo.utilities import rng, set_seed
+from cleo.utilities import (
+    _RGB_LUT_TUPLES,
+    _orth_basis_for_V,
+    get_orth_vectors_for_V,
+    rng,
+    set_seed,
+    wavelength_to_rgb,
+    xyz_from_rθz,
+)
 
 
 def test_set_seed():
@@ -15,5 +25,70 @@ def test_set_seed():
     assert first_random_number == second_random_number
 
 
+@pytest.mark.parametrize(
+    "V", [(0, 0, 1), (0, 0, -1), (1, 0, 0), (0, 1e-9, -1), np.random.randn(100, 3)]
+)
+@pytest.mark.parametrize("orth_fn", [get_orth_vectors_for_V, _orth_basis_for_V])
+def test_get_orth_vectors_for_V(V, orth_fn):
+    V = np.reshape(V, (-1, 3)).astype(float)
+    V /= np.linalg.norm(V, axis=-1, keepdims=True)
+    W1, W2 = orth_fn(V)
+    W1, W2 = W1.reshape(V.shape), W2.reshape(V.shape)
+    # orthonormal frame
+    assert np.allclose(np.sum(W1 * V, axis=-1), 0)
+    assert np.allclose(np.sum(W2 * V, axis=-1), 0)
+    assert np.allclose(np.sum(W1 * W2, axis=-1), 0)
+    assert np.allclose(np.linalg.norm(W1, axis=-1), 1)
+    assert np.allclose(np.linalg.norm(W2, axis=-1), 1)
+    if orth_fn is _orth_basis_for_V:
+        # closed form is also right-handed
+        assert np.allclose(np.cross(W1, W2), V)
+
+
+def test_xyz_from_rθz_units():
+    start, end = (0, 0, 0) * mm, (0, 0, 1) * mm
+    x, y, z = xyz_from_rθz([0.1] * mm, np.array([0]), [0.5] * mm, start, end)
+    assert np.allclose(np.hypot(x / mm, y / mm), 0.1) and np.allclose(z / mm, 0.5)
+    # unitless radii or heights are not silently read as meters
+    with pytest.raises(DimensionMismatchError):
+        xyz_from_rθz(np.array([0.1]), np.array([0]), [0.5] * mm, start, end)
+    with pytest.raises(DimensionMismatchError):
+        xyz_from_rθz([0.1] * mm, np.array([0]), np.array([0.5]), start, end)
+
+
+def test_wavelength_to_rgb():
+    # scalar in, tuple out
+    assert wavelength_to_rgb(473 * nmeter) == pytest.approx((0, 0.717, 1), abs=1e-3)
+    assert wavelength_to_rgb(590 * nmeter) == pytest.approx((1, 0.875, 0), abs=1e-3)
+    # clipped outside visible range
+    assert wavelength_to_rgb(200 * nmeter) == wavelength_to_rgb(380 * nmeter)
+    assert wavelength_to_rgb(1000 * nmeter) == wavelength_to_rgb(750 * nmeter)
+
+    # array in, (..., 3) out matching scalar results, including at boundaries
+    lambdas = np.array([300, 380, 440, 473, 490, 510, 580, 645, 700, 750, 800])
+    rgb = wavelength_to_rgb(lambdas * nmeter)
+    assert rgb.shape == (len(lambdas), 3)
+    for lam, c in zip(lambdas, rgb):
+        assert np.allclose(c, wavelength_to_rgb(lam * nmeter))
+    assert np.all((rgb >= 0) & (rgb <= 1))
+    grid = lambdas.reshape((1, -1)) * nmeter
+    assert wavelength_to_rgb(grid).shape == (1, len(lambdas), 3)
+
+    # whole-nm lookup agrees with direct computation in between and off default
+    assert np.allclose(
+        wavelength_to_rgb(473.5 * nmeter),
+        wavelength_to_rgb([473, 474] * nmeter).mean(axis=0),
+        atol=1e-2,
+    )
+    assert wavelength_to_rgb(473 * nmeter, gamma=1) != wavelength_to_rgb(473 * nmeter)
+
+    # every whole nm hits the table despite float error from unit conversion
+    # (e.g., 490 * nmeter / nmeter == 490.00000000000006)
+    lambdas = np.arange(380, 751)
+    for lam in lambdas:
+        assert wavelength_to_rgb(lam * nmeter) is _RGB_LUT_TUPLES[lam - 380]
+    assert np.allclose(wavelength_to_rgb(lambdas * nmeter), _RGB_LUT_TUPLES)
+
+
 if __name__ == "__main__":
     pytest.main(["-x", __file__])